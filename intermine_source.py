@@ -8,10 +8,36 @@ The IntermineSource launches a pod that can access all templates defined under a
 specified service. Please see Intermine's tutorials for a detailed overview of there
 python API: https://github.com/intermine/intermine-ws-python-docs .
 """
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import itertools
 import logging
-from typing import Any, Dict, Iterable, List, Optional, Union
-
+import os
+from pathlib import Path
+import threading
+import time
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+import weakref
+
+import cachetools
+from intermine.errors import WebserviceError
+from intermine.query import Query, QueryError, Template
 from intermine.webservice import Service
 import methodtools
 import numpy as np
@@ -35,6 +61,146 @@ INTERMINE_TYPE_MAPPING = {
     "int": int,
 }
 
+# The conversion only depends on the type, the name is only used for logging
+INTERMINE_TYPE_TO_PANDAS = {
+    java_type: _convert_python_dtypes_to_pandas_dtypes(python_type, java_type)
+    for java_type, python_type in INTERMINE_TYPE_MAPPING.items()
+}
+
+DEFAULT_CACHE_DIR = Path.home() / ".bitfount" / "cache" / "intermine"
+# Maximum number of concurrent requests made when fetching a template in chunks
+MAX_FETCH_WORKERS = 4
+# Maximum number of templates whose data is kept in memory by `get_data`
+DATA_CACHE_SIZE = 16
+
+# The data loaded by `get_data`, with the time it was loaded, shared by all sources
+# for the same service, user, template and cache settings. Entries are dropped once
+# every source using them has been garbage collected. Sources are part of reference
+# cycles (through their method caches), so that only happens on the next cyclic
+# garbage collection rather than as soon as the last source is deleted.
+_DATA_CACHE: "cachetools.LRUCache[Hashable, Tuple[float, pd.DataFrame]]" = (
+    cachetools.LRUCache(maxsize=DATA_CACHE_SIZE)
+)
+_DATA_CACHE_USERS: "Counter[Hashable]" = Counter()
+_DATA_CACHE_LOCK = threading.Lock()
+
+
+# The kinds of numpy arrays which convert exactly to arrays of each kind
+_EXACT_NUMPY_KINDS = {"b": "b", "i": "i", "u": "u", "f": "fiu"}
+
+
+class _TemplateViews(NamedTuple):
+    """The output columns of an Intermine template.
+
+    Attributes:
+        views: The intermine paths of the columns, e.g. `Gene.symbol`.
+        columns: The dataframe column names, e.g. `Gene_symbol`.
+        python_types: The python types of the columns.
+        dtypes: The pandas dtypes of the columns.
+    """
+
+    views: Tuple[str, ...]
+    columns: Tuple[str, ...]
+    python_types: Tuple[type, ...]
+    dtypes: Tuple[Any, ...]
+
+
+class _ServiceTemplates(NamedTuple):
+    """The templates of an Intermine service.
+
+    Attributes:
+        names: The names of all the templates of the service.
+        names_set: The names of all the templates, for membership tests.
+        user_map: The user owning each template.
+    """
+
+    names: List[str]
+    names_set: FrozenSet[str]
+    user_map: Mapping[str, str]
+
+
+def _to_typed_array(values: Sequence[Any], dtype: Any) -> Any:
+    """Convert the values of a column to an array of the given dtype.
+
+    Numeric and boolean columns are converted to a numpy array first, which pandas
+    wraps without inspecting every value. This is only done if numpy infers a type
+    which converts exactly to the dtype, e.g. not for missing values or for floats
+    in an integer column, which are left to pandas to convert or reject.
+
+    Falls back to letting pandas infer the dtype if the values cannot be converted,
+    e.g. if the service returns values that don't match the template view type.
+    """
+    numpy_dtype = getattr(dtype, "numpy_dtype", None)
+    try:
+        if numpy_dtype is not None and numpy_dtype.kind in _EXACT_NUMPY_KINDS:
+            array = np.asarray(values)
+            if array.dtype.kind in _EXACT_NUMPY_KINDS[numpy_dtype.kind]:
+                return pd.array(array.astype(numpy_dtype, copy=False), dtype=dtype)
+        return pd.array(values, dtype=dtype)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Unable to convert column to {dtype}, inferring dtype: {e}")
+        return pd.Series(values).array
+
+
+def _sort_distinct_values(values: Any) -> Any:
+    """Sort the distinct values of a column in ascending order.
+
+    Missing values are sorted last. Values which can't be compared with each other
+    (e.g. if the dtype had to be inferred) are left in the order given.
+    """
+    try:
+        return values[values.argsort()]
+    except TypeError as e:
+        logger.debug(f"Unable to sort distinct values, leaving them unsorted: {e}")
+        return values
+
+
+def _release_data_cache_keys(keys: Set[Hashable]) -> None:
+    """Release the data cache entries used by a source which no longer exists.
+
+    Entries which are not used by any other source are dropped from the cache.
+    """
+    with _DATA_CACHE_LOCK:
+        for key in keys:
+            _DATA_CACHE_USERS[key] -= 1
+            if _DATA_CACHE_USERS[key] <= 0:
+                del _DATA_CACHE_USERS[key]
+                _DATA_CACHE.pop(key, None)
+
+
+def _make_read_only(data: Union[pd.DataFrame, pd.Series]) -> None:
+    """Mark the numpy arrays backing cached data as read-only.
+
+    Modifying the cached data in place then raises an error rather than silently
+    changing what later calls return. Arrays not backed by numpy are left as is.
+    """
+    columns = [data] if isinstance(data, pd.Series) else [c for _, c in data.items()]
+    for column in columns:
+        array = column.array
+        for name in ("_ndarray", "_data", "_mask"):
+            buffer = getattr(array, name, None)
+            # Columns are views onto the dataframe's blocks, so the arrays they
+            # are based on need to be read-only too
+            while isinstance(buffer, np.ndarray):
+                buffer.setflags(write=False)
+                buffer = buffer.base
+
+
+def _rows_to_df(rows: Sequence[Sequence[Any]], dtypes: _Dtypes) -> pd.DataFrame:
+    """Build a dataframe with the given columns and dtypes from rows of results.
+
+    The rows are transposed into columns which are converted directly to their
+    dtypes, rather than having pandas infer the dtype of every column.
+    """
+    columns: Iterable[Sequence[Any]] = zip(*rows) if rows else [()] * len(dtypes)
+    return pd.DataFrame(
+        {
+            name: _to_typed_array(values, dtype)
+            for (name, dtype), values in zip(dtypes.items(), columns)
+        },
+        copy=False,
+    )
+
 
 @delegates()
 class IntermineSource(MultiTableSource):
@@ -46,6 +212,27 @@ class IntermineSource(MultiTableSource):
     specified service. Please see Intermine's tutorials for a detailed overview of their
     python API: https://github.com/intermine/intermine-ws-python-docs.
 
+    Args:
+        service_url: The URL of the Intermine web service.
+        token: The Intermine user token used to access the service.
+        template_name: The name of the template to restrict the source to. If not
+            provided, all templates under the service are accessible.
+        use_cache: Whether to persist the results of each template to disk so that
+            they are not re-fetched from the service. Defaults to True.
+        cache_dir: The directory in which to persist template results. Defaults to
+            `~/.bitfount/cache/intermine`.
+        cache_ttl: The number of seconds after which a persisted template result is
+            considered stale and is re-fetched. Defaults to None, i.e. results are
+            only re-fetched when the release of the service changes.
+        chunk_size: The number of rows requested from the service at a time when
+            fetching a template in parallel. Defaults to 10,000.
+        parallel_fetch: Whether to fetch templates larger than `chunk_size` in
+            chunks requested concurrently. Set to False to fetch the results of a
+            template in a single request. Defaults to True.
+
+    Raises:
+        ValueError: If `chunk_size` is less than 1.
+
     :::info
 
     You must `pip install intermine` to use this data source.
@@ -58,45 +245,114 @@ class IntermineSource(MultiTableSource):
         service_url: str,
         token: Optional[str] = None,
         template_name: Optional[str] = None,
+        use_cache: bool = True,
+        cache_dir: Optional[Union[str, os.PathLike]] = None,
+        cache_ttl: Optional[float] = None,
+        chunk_size: int = 10_000,
+        parallel_fetch: bool = True,
         **kwargs: Any,
     ) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+
         super().__init__(**kwargs)
-        self.service = Service(service_url, token=token)
-        self.all_templates_names: Dict[
-            str, List[str]
-        ] = self.service.all_templates_names
+        # The service is only contacted once it is needed
+        self.service_url = service_url
+        self._token = token
+        self._service: Optional[Service] = None
+        # A digest of the token is used to key the caches by user, so that the
+        # token itself doesn't end up in cache keys or file names
+        self._token_hash = hashlib.sha256((token or "").encode()).hexdigest()
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_ttl = cache_ttl
+        self.chunk_size = chunk_size
+        self.parallel_fetch = parallel_fetch
+        # The keys of the data cache used by this source, released once it is
+        # garbage collected
+        self._data_cache_keys: Set[Hashable] = set()
+        weakref.finalize(self, _release_data_cache_keys, self._data_cache_keys)
         self.template_name = template_name
+        self._table_names = [template_name] if template_name is not None else None
+        # Known up front if pinned to a template, else once the templates are fetched
+        self._multi_table: Optional[bool] = False if template_name is not None else None
 
-        self.template_to_user_map = {
-            t: user
-            for user, tables in self.service.all_templates_names.items()
-            for t in tables
-        }
-        self._check_duplicate_templates()
-
-    def _check_duplicate_templates(self) -> None:
-        """Check for duplicate template names in intermine service."""
-        table_names = set()
-        for t in self.table_names:
-            if t in table_names:
-                raise ValueError(
-                    f"Duplicated template name: '{t}', found in service. "
-                    "Template names must have unique names."
-                )
-            table_names.add(t)
+    @property
+    def service(self) -> Service:
+        """The client for the Intermine web service, created on first use."""
+        if self._service is None:
+            self._service = Service(self.service_url, token=self._token)
+        return self._service
+
+    @methodtools.lru_cache(maxsize=1)
+    def _all_templates_names(self) -> Dict[str, List[str]]:
+        """Fetch the names of the templates of each user of the service.
+
+        The templates are checked for duplicate names when first fetched.
+        """
+        all_templates_names: Dict[str, List[str]] = self.service.all_templates_names
+        self._check_duplicate_templates(all_templates_names)
+        return all_templates_names
+
+    @methodtools.lru_cache(maxsize=1)
+    def _get_service_templates(self) -> _ServiceTemplates:
+        """Get the templates of the service, which are fixed once fetched."""
+        all_templates_names = self._all_templates_names()
+        names = list(itertools.chain.from_iterable(all_templates_names.values()))
+        return _ServiceTemplates(
+            names=names,
+            names_set=frozenset(names),
+            user_map=MappingProxyType(
+                {
+                    t: user
+                    for user, tables in all_templates_names.items()
+                    for t in tables
+                }
+            ),
+        )
+
+    def _check_duplicate_templates(
+        self, all_templates_names: Dict[str, List[str]]
+    ) -> None:
+        """Check for duplicate template names in intermine service.
+
+        Templates are looked up by name only, so the name of each table of this
+        source must be unique across all the users of the service.
+        """
+        counts = Counter(itertools.chain.from_iterable(all_templates_names.values()))
+        if not counts or counts.most_common(1)[0][1] == 1:
+            return
+
+        table_names = self._table_names if self._table_names is not None else counts
+        duplicates = [t for t in table_names if counts[t] > 1]
+        if duplicates:
+            names = ", ".join(f"'{t}'" for t in duplicates)
+            raise ValueError(
+                f"Duplicated template name(s): {names}, found in service. "
+                "Template names must have unique names."
+            )
+
+    @property
+    def all_templates_names(self) -> Dict[str, List[str]]:
+        """The names of the templates of each user of the service."""
+        return self._all_templates_names()
+
+    @property
+    def template_to_user_map(self) -> Mapping[str, str]:
+        """The user owning each template of the service."""
+        return self._get_service_templates().user_map
 
     @property
     def table_names(self) -> List[str]:
         """The names of the tables accessible from this data source."""
-
-        if self.template_name is not None:
-            return [self.template_name]
+        if self._table_names is not None:
+            return self._table_names
 
         return self.template_names
 
     @property
     def template_names(self) -> List[str]:
-        return list(itertools.chain(*self.all_templates_names.values()))
+        return self._get_service_templates().names
 
     def _validate_table_name(self, table_name: Optional[str] = None) -> None:
         """Validate the table name exists as a template in the Intermine service.
@@ -109,11 +365,15 @@ class IntermineSource(MultiTableSource):
             ValueError: If the table name is not found in the data.
             ValueError: If the database connection does not have any table names.
         """
-        if table_name is None:
+        # A valid name is a single set lookup, the remaining checks only work out
+        # which error to raise
+        if table_name in self._get_service_templates().names_set:
+            return
+        elif table_name is None:
             raise ValueError("No table name provided for Intermine service.")
         elif not self.table_names:
             raise ValueError(f"Service {self.service} did not return any templates.")
-        elif table_name not in self.template_names:
+        else:
             raise ValueError(
                 f"Template name {table_name} not found in service: {self.service}. "
                 f"Available tables: {self.template_names}"
@@ -132,19 +392,87 @@ class IntermineSource(MultiTableSource):
 
         Returns:
             The distinct values of the requested column as a mapping from col name to
-            a series of distinct values.
+            a series of distinct values. The values are sorted in ascending order,
+            with any missing value last.
+
+        Raises:
+            KeyError: If a column is not found in the table.
         """
         output: Dict[str, Iterable[Any]] = {}
-        if table_name:
-            self._validate_table_name(table_name)
+        if not table_name:
+            return output
+
+        self._validate_table_name(table_name)
+        template_views = self._get_template_views(table_name)
+        python_types = dict(zip(template_views.columns, template_views.python_types))
+        # Check every column up front so nothing is requested for unknown columns
+        all_str_columns = all(python_types[col_name] is str for col_name in col_names)
+
+        # Prefer results which are already loaded, then the service's summaries of
+        # the columns, and only load the whole template for any columns left over.
+        # Summaries are only requested if they cover every column, as the whole
+        # template would have to be loaded anyway otherwise
+        data = self._get_cached_data(table_name)
+        if data is None and self.use_cache:
+            data = self._read_cached_df(
+                table_name, self._template_cache_path(table_name), col_names
+            )
+        if data is None and all_str_columns:
+            output.update(self._get_distinct_values(table_name, col_names))
+        if data is None and len(output) < len(col_names):
+            data = self._get_shared_data(table_name)
+
+        for col_name in col_names:
+            if col_name not in output:
+                assert data is not None
+                # Hash the underlying array directly rather than via the Series
+                output[col_name] = pd.unique(data[col_name].array)
+        # The summaries are ordered by count and the results by row, so the values
+        # are sorted to give the same order whichever way they were found
+        return {
+            col_name: _sort_distinct_values(output[col_name]) for col_name in col_names
+        }
+
+    def _get_distinct_values(
+        self, template_name: str, col_names: List[str]
+    ) -> Dict[str, Iterable[Any]]:
+        """Get the distinct values of string columns of a template from the service.
 
-            data = self._template_to_df(table_name)
-            for col_name in col_names:
-                output[col_name] = data[col_name].unique()
+        The service summarises a string view as the count of each of its distinct
+        values, so only the distinct values are transferred rather than every row.
+        Other views are summarised differently (e.g. numeric views as their
+        min/max/mean) so only string columns should be given. Columns which can't
+        be summarised are not included.
+        """
+        template = self._get_template(template_name)
+        template_views = self._get_template_views(template_name)
+        dtypes = self._get_dtypes(template_name)
+        views = dict(zip(template_views.columns, template_views.views))
+
+        output: Dict[str, Iterable[Any]] = {}
+        for col_name in col_names:
+            view = views[col_name]
+            # Template.summarise passes the summary path on as a constraint code,
+            # so the summary is requested through Query.results instead
+            try:
+                summary = Query.results(
+                    template.get_adjusted_template({}),
+                    row="jsonrows",
+                    summary_path=view,
+                )
+                items = [r["item"] for r in summary]
+            except (QueryError, WebserviceError) as e:
+                logger.debug(f"Unable to summarise {view} of {template_name}: {e}")
+                continue
+            output[col_name] = _to_typed_array(items, dtypes[col_name])
         return output
 
     def get_column(
-        self, col_name: str, table_name: Optional[str] = None, **kwargs: Any
+        self,
+        col_name: str,
+        table_name: Optional[str] = None,
+        copy: bool = False,
+        **kwargs: Any,
     ) -> Union[np.ndarray, pd.Series]:
         """Get single column from dataset.
 
@@ -152,38 +480,214 @@ class IntermineSource(MultiTableSource):
             col_name: The name of the column which should be loaded.
             table_name: The name of the table to which the column exists. Required
                 for multi-table databases.
+            copy: Whether to return a copy of the column. Defaults to False.
 
         Returns:
             The column requested as a series.
 
+            Unless `copy` is set, the column may share memory with the cached data
+            of the template, in which case it is read-only. Pass `copy=True` to get
+            a copy that can be modified.
+
         Raises:
             ValueError: If the data is multi-table but no table name provided.
             ValueError: If the table name is not found in the data.
         """
         if table_name:
             self._validate_table_name(table_name)
-            data = self._template_to_df(table_name)
-
-            return data[col_name]
+            column = self._get_template_column(table_name, col_name)
+            return column.copy() if copy else column
         else:
             raise ValueError("Expected parameter: table_name.")
 
-    def _template_to_df(self, template_name: str) -> pd.DataFrame:
-        """Transform intermine template to pandas dataframe."""
+    @methodtools.lru_cache(maxsize=None)
+    def _get_template(self, template_name: str) -> Template:
+        """Fetch the Intermine template object for a template name.
+
+        The result is cached as every lookup is a round-trip to the web service.
+        """
         user = self.template_to_user_map[template_name]
-        template = self.service.get_template_by_user(template_name, user)
+        return self.service.get_template_by_user(template_name, user)
 
-        return pd.DataFrame(
-            template.results(row="list"),
-            columns=[col.replace(".", "_") for col in template.views],
+    @methodtools.lru_cache(maxsize=None)
+    def _get_template_views(self, template_name: str) -> _TemplateViews:
+        """Get the views of a template with their column names and types."""
+        template = self._get_template(template_name)
+        views = tuple(template.views)
+        # intermine view_types are given in their java types
+        view_types = tuple(template.view_types)
+        return _TemplateViews(
+            views=views,
+            columns=tuple(view.replace(".", "_") for view in views),
+            python_types=tuple(INTERMINE_TYPE_MAPPING[t] for t in view_types),
+            dtypes=tuple(INTERMINE_TYPE_TO_PANDAS[t] for t in view_types),
         )
 
-    @methodtools.lru_cache(maxsize=1)
+    @methodtools.lru_cache(maxsize=None)
+    def _get_dtypes(self, template_name: str) -> _Dtypes:
+        """Get the mapping from column names to column types of a template."""
+        template_views = self._get_template_views(template_name)
+        return dict(zip(template_views.columns, template_views.dtypes))
+
+    @methodtools.lru_cache(maxsize=None)
+    def _get_row_count(self, template_name: str) -> int:
+        """Get the number of rows of a template without fetching its results."""
+        return int(self._get_template(template_name).count())
+
+    def _template_cache_path(self, template_name: str) -> Path:
+        """Get the path at which the results of a template are persisted.
+
+        The path is keyed on the service, its data release, the template and the
+        user token so that a new release of the data invalidates the cache.
+        """
+        key = "\0".join(
+            (
+                self.service.root,
+                str(self.service.release),
+                self.template_to_user_map[template_name],
+                template_name,
+                self._token_hash,
+            )
+        )
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.parquet"
+
+    def _read_cached_df(
+        self,
+        template_name: str,
+        cache_path: Path,
+        columns: Optional[List[str]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Read a persisted template dataframe if present and not stale.
+
+        If `columns` is provided, only those columns are read. The columns are
+        converted to the current dtypes of the template, so that results persisted
+        with other dtypes are returned with the same dtypes as freshly fetched ones.
+        Results whose columns no longer match the template are treated as stale.
+
+        Raises:
+            KeyError: If any of `columns` is not a column of the template.
+        """
+        dtypes = self._get_dtypes(template_name)
+        if columns is not None:
+            unknown_columns = [c for c in columns if c not in dtypes]
+            if unknown_columns:
+                raise KeyError(
+                    f"Columns {unknown_columns} not found in template {template_name}."
+                )
+
+        try:
+            age = time.time() - cache_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        if self.cache_ttl is not None and age > self.cache_ttl:
+            logger.debug(f"Cached template results at {cache_path} are stale.")
+            return None
+
+        expected_columns = columns if columns is not None else list(dtypes)
+        try:
+            df = pd.read_parquet(cache_path, columns=columns)
+            if list(df.columns) != expected_columns:
+                logger.debug(f"Cached template results at {cache_path} are stale.")
+                return None
+            # A no-op for columns which already have the right dtype
+            return df.astype({c: dtypes[c] for c in expected_columns}, copy=False)
+        except (ImportError, OSError, TypeError, ValueError) as e:
+            logger.warning(f"Unable to read cached template results: {e}")
+            return None
+
+    def _write_cached_df(self, df: pd.DataFrame, cache_path: Path) -> None:
+        """Persist a template dataframe, leaving no partial file on failure."""
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except (ImportError, OSError, TypeError, ValueError) as e:
+            logger.warning(f"Unable to cache template results: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _template_to_df(self, template_name: str) -> pd.DataFrame:
+        """Transform intermine template to pandas dataframe.
+
+        If `use_cache` is set, the dataframe is read from, or persisted to, the
+        on-disk cache rather than always being fetched from the service.
+        """
+        if not self.use_cache:
+            return self._fetch_template_df(template_name)
+
+        cache_path = self._template_cache_path(template_name)
+        df = self._read_cached_df(template_name, cache_path)
+        if df is None:
+            df = self._fetch_template_df(template_name)
+            self._write_cached_df(df, cache_path)
+        return df
+
+    def _fetch_template_df(self, template_name: str) -> pd.DataFrame:
+        """Fetch the results of an intermine template from the service."""
+        dtypes = self._get_dtypes(template_name)
+        return _rows_to_df(self._fetch_template_rows(template_name), dtypes)
+
+    def _fetch_template_rows(self, template_name: str) -> List[List[Any]]:
+        """Fetch the result rows of an intermine template from the service.
+
+        If `parallel_fetch` is set, templates with more than `chunk_size` rows are
+        requested in chunks of `chunk_size` rows concurrently.
+        """
+        template = self._get_template(template_name)
+        if not self.parallel_fetch:
+            return list(template.results(row="list"))
+
+        # Not the memoized count used by `__len__`, which is never refreshed and
+        # would drop any rows added since it was counted
+        n_rows = int(template.count())
+        if n_rows <= self.chunk_size:
+            return list(template.results(row="list"))
+
+        def fetch_chunk(start: int) -> List[List[Any]]:
+            return list(
+                template.results(row="list", start=start, size=self.chunk_size)
+            )
+
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            # map yields the chunks in order, so the rows keep the template order
+            chunks = executor.map(fetch_chunk, range(0, n_rows, self.chunk_size))
+            return list(itertools.chain.from_iterable(chunks))
+
+    def _get_template_column(self, template_name: str, col_name: str) -> pd.Series:
+        """Get a single column of an intermine template.
+
+        The column is taken from the shared data cache if the template has been
+        loaded, else read from the on-disk cache if present. Otherwise the whole
+        template is loaded into the shared data cache, so that getting its other
+        columns doesn't fetch it again. The template results service always returns
+        the views stored on the server, so a request can't be narrowed to a column.
+        """
+        data = self._get_cached_data(template_name)
+        if data is None and self.use_cache:
+            data = self._read_cached_df(
+                template_name, self._template_cache_path(template_name), [col_name]
+            )
+        if data is None:
+            data = self._get_shared_data(template_name)
+        return data[col_name]
+
     def get_data(
         self, table_name: Optional[str] = None, **kwargs: Any
     ) -> Optional[pd.DataFrame]:
         """Loads and returns data from Intermine template.
 
+        The data of the `DATA_CACHE_SIZE` most recently used templates is cached
+        in memory, so repeated calls for the same template return the same
+        DataFrame object. Its underlying arrays are read-only, so callers must
+        `.copy()` the result before modifying it in place.
+
+        The cached data is shared with other sources for the same service and user
+        which have the same `cache_dir` and `cache_ttl`, and is re-loaded once it
+        was loaded more than `cache_ttl` seconds ago. If `use_cache` is False, the
+        cached data is only used by this source, so it never receives data loaded
+        by another source.
+
         Args:
             table_name: Table name for multi table data sources. This
                 comes from the DataStructure.
@@ -191,20 +695,68 @@ class IntermineSource(MultiTableSource):
         Returns:
             A DataFrame-type object which contains the data.
         """
-        data: Optional[pd.DataFrame] = None
         if not self.multi_table:
             table_name = self.table_names[0]
 
-        if table_name:
-            self._validate_table_name(table_name)
-            data = self._template_to_df(table_name)
+        if not table_name:
+            return None
+        return self._get_shared_data(table_name, **kwargs)
+
+    def _data_cache_key(self, table_name: str, **kwargs: Any) -> Hashable:
+        """Get the key of the data of a template in the shared data cache."""
+        freshness = (self.cache_dir, self.cache_ttl) if self.use_cache else id(self)
+        return (
+            self.service_url,
+            self._token_hash,
+            table_name,
+            tuple(sorted(kwargs.items())),
+            freshness,
+        )
+
+    def _get_cached_data(
+        self, table_name: str, **kwargs: Any
+    ) -> Optional[pd.DataFrame]:
+        """Get the data of a template if it is in the shared data cache.
 
-        if data is not None and data.empty:
+        Data loaded more than `cache_ttl` seconds ago is treated as missing.
+        """
+        with _DATA_CACHE_LOCK:
+            entry = _DATA_CACHE.get(self._data_cache_key(table_name, **kwargs))
+        if entry is None:
+            return None
+
+        loaded_at, data = entry
+        if self.cache_ttl is not None and time.time() - loaded_at > self.cache_ttl:
+            return None
+        return data
+
+    def _get_shared_data(self, table_name: str, **kwargs: Any) -> pd.DataFrame:
+        """Get the data of a template through the shared data cache."""
+        key = self._data_cache_key(table_name, **kwargs)
+        with _DATA_CACHE_LOCK:
+            if key not in self._data_cache_keys:
+                self._data_cache_keys.add(key)
+                _DATA_CACHE_USERS[key] += 1
+
+        data = self._get_cached_data(table_name, **kwargs)
+        if data is None:
+            data = self._get_data(table_name, **kwargs)
+            with _DATA_CACHE_LOCK:
+                _DATA_CACHE[key] = (time.time(), data)
+        return data
+
+    def _get_data(self, table_name: str, **kwargs: Any) -> pd.DataFrame:
+        """Uncached implementation of `get_data`."""
+        self._validate_table_name(table_name)
+        data = self._template_to_df(table_name)
+
+        if data.empty:
             # Otherwise we get a more cryptic
             # "One of `datasource` and `datasources` must be specified" from
             # federated/pod.py
             raise ValueError("Empty dataset")
 
+        _make_read_only(data)
         return data
 
     def get_dtypes(self, table_name: Optional[str] = None, **kwargs: Any) -> _Dtypes:
@@ -218,33 +770,25 @@ class IntermineSource(MultiTableSource):
             A mapping from column names to column types.
         """
         self._validate_table_name(table_name)
-        user = self.template_to_user_map[table_name]
-        template = self.service.get_template_by_user(table_name, user)
-        # intermine view_types are given in their java types
-        java_dtypes = dict(zip(template.views, template.view_types))
-        dtypes = {
-            k.replace(".", "_"): _convert_python_dtypes_to_pandas_dtypes(
-                INTERMINE_TYPE_MAPPING[v], k
-            )
-            for k, v in java_dtypes.items()
-        }
-        return dtypes
+        assert table_name is not None
+        # Copied so that callers can't modify the cached mapping
+        return dict(self._get_dtypes(table_name))
 
     def __len__(self) -> int:
         if self._data_is_loaded:
             return len(self.data)
         elif not self.multi_table:
-            data = self.get_data()
-            assert data is not None
-            self.data = data
-            return len(self.data)
+            # Ask the service for the count rather than fetching all of the data
+            return self._get_row_count(self.table_names[0])
 
         raise ValueError("Can't ascertain length of multi-table Intermine dataset.")
 
     @property
     def multi_table(self) -> bool:
         """Attribute to specify whether the datasource is multi table."""
-        return len(self.table_names) > 1
+        if self._multi_table is None:
+            self._multi_table = len(self.table_names) > 1
+        return self._multi_table
 
     def get_column_names(
         self, table_name: Optional[str] = None, **kwargs: Any
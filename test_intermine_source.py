@@ -0,0 +1,394 @@
+"""Tests for the IntermineSource class.
+
+The tests run against real intermine `Template` objects, with the web service
+replaced by a stub that returns canned results.
+"""
+import os
+from pathlib import Path
+import time
+from typing import Any, Dict, Iterator, List
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("bitfount")
+pytest.importorskip("intermine.webservice")
+
+from intermine.model import Model  # noqa: E402
+from intermine.query import Template  # noqa: E402
+
+import intermine_source  # noqa: E402
+from intermine_source import IntermineSource, _to_typed_array  # noqa: E402
+
+MODEL_XML = """
+<model name="genomic" package="org.intermine.model.bio">
+  <class name="Gene" is-interface="true">
+    <attribute name="symbol" type="java.lang.String"/>
+    <attribute name="length" type="java.lang.Integer"/>
+  </class>
+</model>
+"""
+
+TEMPLATE_XML = """
+<template name="gene_lengths" title="Gene lengths" comment="">
+  <query name="gene_lengths" model="genomic" view="Gene.symbol Gene.length"
+         sortOrder="Gene.symbol asc">
+    <constraint path="Gene.length" op="&gt;" value="0" code="A" editable="true"/>
+  </query>
+</template>
+"""
+
+
+class _StubService:
+    """Stand-in for `intermine.webservice.Service` which records requests."""
+
+    TEMPLATEQUERY_PATH = "/template/results"
+    prefetch_depth = 1
+    prefetch_id_only = False
+    root = "http://example.org/service"
+    release = "1"
+    all_templates_names = {"user": ["gene_lengths"]}
+
+    def __init__(self, rows: List[List[Any]]) -> None:
+        self.model = Model(MODEL_XML)
+        self.rows = rows
+        self.requests: List[Dict[str, Any]] = []
+
+    def get_template_by_user(self, name: str, user: str) -> Template:
+        template = Template.from_xml(TEMPLATE_XML, self.model, self)
+        template.user_name = user
+        template.view_types = ["java.lang.String", "java.lang.Integer"]
+        return template
+
+    def get_results(
+        self, path: str, params: Dict[str, Any], row: str, view: Any, cld: Any
+    ) -> Iterator[Any]:
+        self.requests.append(dict(params, path=path, row=row))
+        if "summaryPath" in params:
+            column = view.index(params["summaryPath"])
+            counts: Dict[Any, int] = {}
+            for r in self.rows:
+                counts[r[column]] = counts.get(r[column], 0) + 1
+            # The service orders summaries by descending count
+            items = sorted(counts.items(), key=lambda item: -item[1])
+            return iter({"item": k, "count": v} for k, v in items)
+        if row == "count":
+            return iter([str(len(self.rows))])
+        start = params.get("start", 0)
+        size = params.get("size")
+        return iter(self.rows[start : start + size if size else None])
+
+
+class _SlowFirstPageService(_StubService):
+    """Stub service which returns the first page of results after the others."""
+
+    def get_results(
+        self, path: str, params: Dict[str, Any], row: str, view: Any, cld: Any
+    ) -> Iterator[Any]:
+        if params.get("start") == 0 and params.get("size"):
+            time.sleep(0.1)
+        return super().get_results(path, params, row, view, cld)
+
+
+@pytest.fixture
+def service() -> _StubService:
+    return _StubService([["eve", 300], ["zen", 100], ["eve", 200]])
+
+
+@pytest.fixture
+def source(service: _StubService) -> IntermineSource:
+    source = IntermineSource(
+        "http://example.org/service", use_cache=False, parallel_fetch=False
+    )
+    source._service = service
+    return source
+
+
+def test_get_values_summarises_string_columns_on_the_service(
+    service: _StubService, source: IntermineSource
+) -> None:
+    values = source.get_values(["Gene_symbol"], table_name="gene_lengths")
+
+    assert list(values["Gene_symbol"]) == ["eve", "zen"]
+    assert len(service.requests) == 1
+    request = service.requests[0]
+    assert request["path"] == "/template/results"
+    assert request["name"] == "gene_lengths"
+    assert request["summaryPath"] == "Gene.symbol"
+
+
+def test_get_values_loads_template_for_numeric_columns(
+    service: _StubService, source: IntermineSource
+) -> None:
+    values = source.get_values(
+        ["Gene_symbol", "Gene_length"], table_name="gene_lengths"
+    )
+
+    assert list(values) == ["Gene_symbol", "Gene_length"]
+    assert list(values["Gene_symbol"]) == ["eve", "zen"]
+    assert list(values["Gene_length"]) == [100, 200, 300]
+    assert [r.get("summaryPath") for r in service.requests] == [None]
+
+
+def test_get_values_order_is_the_same_however_the_values_are_found(
+    service: _StubService, source: IntermineSource
+) -> None:
+    service.rows = [["zen", 1], ["eve", 2], ["zen", 3]]
+    summarised = source.get_values(["Gene_symbol"], table_name="gene_lengths")
+    source.get_data("gene_lengths")
+    loaded = source.get_values(["Gene_symbol"], table_name="gene_lengths")
+
+    assert list(summarised["Gene_symbol"]) == list(loaded["Gene_symbol"])
+    assert list(loaded["Gene_symbol"]) == ["eve", "zen"]
+
+
+def test_get_values_uses_loaded_template(
+    service: _StubService, source: IntermineSource
+) -> None:
+    source.get_data("gene_lengths")
+    source.get_values(["Gene_symbol", "Gene_length"], table_name="gene_lengths")
+
+    assert [r["row"] for r in service.requests] == ["list"]
+
+
+def test_get_values_unknown_column_makes_no_request(
+    service: _StubService, source: IntermineSource
+) -> None:
+    with pytest.raises(KeyError):
+        source.get_values(["Gene_symbol", "Gene_name"], table_name="gene_lengths")
+    assert service.requests == []
+
+
+def test_get_column_keeps_template_row_order(
+    service: _StubService, source: IntermineSource
+) -> None:
+    column = source.get_column("Gene_length", table_name="gene_lengths")
+
+    data = source.get_data("gene_lengths")
+    assert data is not None
+    assert column.tolist() == data["Gene_length"].tolist() == [300, 100, 200]
+
+
+def test_get_data_is_shared_between_sources_with_same_cache_settings(
+    service: _StubService, tmp_path: Path
+) -> None:
+    sources = []
+    for _ in range(2):
+        source = IntermineSource(
+            "http://example.org/service", cache_dir=tmp_path, parallel_fetch=False
+        )
+        source._service = service
+        sources.append(source)
+
+    assert sources[0].get_data("gene_lengths") is sources[1].get_data("gene_lengths")
+
+
+def test_get_data_is_not_shared_with_sources_without_cache(
+    service: _StubService, source: IntermineSource, tmp_path: Path
+) -> None:
+    cached_source = IntermineSource(
+        "http://example.org/service", cache_dir=tmp_path, parallel_fetch=False
+    )
+    cached_source._service = service
+    other_source = IntermineSource(
+        "http://example.org/service", use_cache=False, parallel_fetch=False
+    )
+    other_source._service = service
+
+    data = cached_source.get_data("gene_lengths")
+    assert source.get_data("gene_lengths") is not data
+    assert other_source.get_data("gene_lengths") is not source.get_data(
+        "gene_lengths"
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_init_rejects_chunk_size_below_one(chunk_size: int) -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        IntermineSource("http://example.org/service", chunk_size=chunk_size)
+
+
+def test_get_column_unknown_column_raises_without_cache_warning(
+    service: _StubService, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    source = IntermineSource(
+        "http://example.org/service", cache_dir=tmp_path, parallel_fetch=False
+    )
+    source._service = service
+    # Persist the template results to the on-disk cache
+    source.get_data("gene_lengths")
+
+    with pytest.raises(KeyError):
+        source.get_column("Gene_name", table_name="gene_lengths")
+    assert "Unable to read cached template results" not in caplog.text
+
+
+def test_fetch_after_template_grows_returns_every_row() -> None:
+    service = _StubService([[f"gene{i}", i] for i in range(25)])
+    source = IntermineSource(
+        "http://example.org/service", use_cache=False, chunk_size=4
+    )
+    source._service = service
+
+    assert len(source) == 25
+    service.rows.extend([f"gene{i}", i] for i in range(25, 40))
+    column = source.get_column("Gene_length", table_name="gene_lengths")
+
+    assert column.tolist() == list(range(40))
+
+
+@pytest.mark.parametrize(
+    "values, dtype, expected",
+    [
+        ([1, 2], "Int64", [1, 2]),
+        ([1.5, 2.5], "Float64", [1.5, 2.5]),
+        ([1, 2], "Float64", [1.0, 2.0]),
+        ([True, False], "boolean", [True, False]),
+        ([1, None], "Int64", [1, pd.NA]),
+        ([1.5, 2.7], "Int64", [1.5, 2.7]),
+        ([True, "x"], "boolean", [True, "x"]),
+        (["false"], "boolean", ["false"]),
+    ],
+)
+def test_to_typed_array_never_converts_values_inexactly(
+    values: List[Any], dtype: str, expected: List[Any]
+) -> None:
+    assert list(_to_typed_array(values, pd.api.types.pandas_dtype(dtype))) == expected
+
+
+def test_shared_get_data_is_reloaded_after_cache_ttl(
+    service: _StubService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sources = []
+    for _ in range(2):
+        source = IntermineSource(
+            "http://example.org/service",
+            cache_dir=tmp_path,
+            cache_ttl=60,
+            parallel_fetch=False,
+        )
+        source._service = service
+        sources.append(source)
+    data = sources[0].get_data("gene_lengths")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+
+    assert sources[1].get_data("gene_lengths") is not data
+
+
+def test_get_column_uses_loaded_template(
+    service: _StubService, source: IntermineSource
+) -> None:
+    source.get_data("gene_lengths")
+    source.get_column("Gene_symbol", table_name="gene_lengths")
+    source.get_column("Gene_length", table_name="gene_lengths")
+
+    assert [r["row"] for r in service.requests] == ["list"]
+
+
+def test_get_column_loads_template_once_for_all_columns(
+    service: _StubService, source: IntermineSource
+) -> None:
+    source.get_column("Gene_symbol", table_name="gene_lengths")
+    source.get_column("Gene_length", table_name="gene_lengths")
+
+    assert [r["row"] for r in service.requests] == ["list"]
+
+
+def test_paged_fetch_keeps_row_order() -> None:
+    service = _SlowFirstPageService([[f"gene{i}", i] for i in range(10)])
+    source = IntermineSource(
+        "http://example.org/service", use_cache=False, chunk_size=3
+    )
+    source._service = service
+
+    column = source.get_column("Gene_length", table_name="gene_lengths")
+
+    assert column.tolist() == list(range(10))
+    pages = sorted(
+        (r["start"], r["size"]) for r in service.requests if r["row"] == "list"
+    )
+    assert pages == [(0, 3), (3, 3), (6, 3), (9, 3)]
+
+
+def test_disk_cache_is_refetched_after_cache_ttl(
+    service: _StubService, tmp_path: Path
+) -> None:
+    source = IntermineSource(
+        "http://example.org/service", cache_dir=tmp_path, parallel_fetch=False
+    )
+    source._service = service
+    source.get_data("gene_lengths")
+    cache_path = source._template_cache_path("gene_lengths")
+    modified = time.time() - 120
+    os.utime(cache_path, (modified, modified))
+    service.requests.clear()
+
+    for cache_ttl, n_requests in [(600, 0), (60, 1)]:
+        other_source = IntermineSource(
+            "http://example.org/service",
+            cache_dir=tmp_path,
+            cache_ttl=cache_ttl,
+            parallel_fetch=False,
+        )
+        other_source._service = service
+        other_source.get_column("Gene_length", table_name="gene_lengths")
+        assert len(service.requests) == n_requests
+
+
+def test_every_duplicate_template_name_is_reported(service: _StubService) -> None:
+    service.all_templates_names = {"a": ["t1", "t2"], "b": ["t1", "t2", "t3"]}
+    source = IntermineSource("http://example.org/service")
+    source._service = service
+
+    with pytest.raises(ValueError, match="'t1', 't2', found"):
+        source.table_names
+
+
+def test_duplicate_template_names_of_other_templates_are_ignored(
+    service: _StubService,
+) -> None:
+    service.all_templates_names = {"a": ["t1", "t3"], "b": ["t1"]}
+    source = IntermineSource("http://example.org/service", template_name="t3")
+    source._service = service
+
+    source._validate_table_name("t3")
+
+
+def test_cached_data_is_read_only_unless_copied(
+    service: _StubService, source: IntermineSource
+) -> None:
+    data = source.get_data("gene_lengths")
+    assert data is not None
+    column = source.get_column("Gene_length", table_name="gene_lengths")
+    with pytest.raises(ValueError, match="read-only"):
+        column.array[0] = 1
+
+    copied = source.get_column("Gene_length", table_name="gene_lengths", copy=True)
+    copied[0] = 1
+
+    assert data["Gene_length"].tolist() == [300, 100, 200]
+
+
+def test_len_counts_rows_without_fetching_them(
+    service: _StubService, source: IntermineSource
+) -> None:
+    assert len(source) == 3
+    assert [r["row"] for r in service.requests] == ["count"]
+
+
+def test_service_is_created_on_first_use(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: List[str] = []
+    monkeypatch.setattr(
+        intermine_source, "Service", lambda url, token: created.append(url)
+    )
+    source = IntermineSource(
+        "http://example.org/service", template_name="gene_lengths"
+    )
+
+    assert source.table_names == ["gene_lengths"]
+    assert not source.multi_table
+    assert created == []
+    source.service
+    assert created == ["http://example.org/service"]